@@ -0,0 +1,124 @@
+"""Tests for the RateLimiter, run with CPython (python -m pytest tests/).
+
+The ticks_ms based clock of micropython is replaced with a fake one, which allows to move the time forward and wraps around like the real one.
+"""
+
+import os
+import sys
+import time
+import types
+
+import pytest
+
+# load the modules without uAPI/__init__.py, which needs the micropython socket modules
+_package = types.ModuleType("uAPI")
+_package.__path__ = [os.path.join(os.path.dirname(__file__), "..", "uAPI")]
+sys.modules.setdefault("uAPI", _package)
+
+from uAPI.rate_limiter import RateLimiter
+
+TICKS_PERIOD = 1 << 30
+
+
+class FakeTicks:
+    """Replacement for time.ticks_ms and time.ticks_diff, wrapping like on micropython."""
+
+    def __init__(self):
+        self.now = 0
+
+    def ticks_ms(self) -> int:
+        return self.now % TICKS_PERIOD
+
+    def ticks_diff(self, a: int, b: int) -> int:
+        return ((a - b + TICKS_PERIOD // 2) % TICKS_PERIOD) - TICKS_PERIOD // 2
+
+    def advance(self, ms: int) -> None:
+        self.now += ms
+
+
+@pytest.fixture
+def ticks(monkeypatch):
+    fake = FakeTicks()
+    monkeypatch.setattr(time, "ticks_ms", fake.ticks_ms, raising=False)
+    monkeypatch.setattr(time, "ticks_diff", fake.ticks_diff, raising=False)
+    return fake
+
+
+def test_burst_is_used_up_and_refilled(ticks):
+    limiter = RateLimiter(rate=2, burst=3)
+
+    assert [limiter.allow("a") for _ in range(4)] == [True, True, True, False]
+
+    # 2 requests per second, so one token after 500ms
+    ticks.advance(500)
+    assert limiter.allow("a")
+    assert not limiter.allow("a")
+
+    # never refilled above the burst
+    ticks.advance(10000)
+    assert [limiter.allow("a") for _ in range(4)] == [True, True, True, False]
+
+
+def test_least_recently_used_key_is_evicted(ticks):
+    limiter = RateLimiter(rate=1, burst=2, capacity=2)
+
+    limiter.allow("a")
+    ticks.advance(10)
+    limiter.allow("b")
+    ticks.advance(10)
+    # "a" is used again, so "b" is the least recently used one now
+    limiter.allow("a")
+    ticks.advance(10)
+
+    assert limiter.allow("c")
+    assert sorted(limiter._slots) == ["a", "c"]
+    # the new key got a full bucket
+    assert limiter.allow("c")
+    assert not limiter.allow("c")
+
+
+def test_negative_ticks_diff_resets_bucket(ticks):
+    limiter = RateLimiter(rate=1, burst=2)
+
+    assert [limiter.allow("a") for _ in range(3)] == [True, True, False]
+
+    # idle for more than half the ticks period, ticks_diff turns negative
+    ticks.advance(TICKS_PERIOD // 2 + 1)
+    assert ticks.ticks_diff(ticks.ticks_ms(), 0) < 0
+
+    assert [limiter.allow("a") for _ in range(3)] == [True, True, False]
+
+
+def test_negative_ticks_diff_is_evicted_first(ticks):
+    limiter = RateLimiter(rate=1, burst=1, capacity=2)
+
+    limiter.allow("a")
+    ticks.advance(TICKS_PERIOD // 2 - 10)
+    limiter.allow("b")
+    # "a" is now older than half the ticks period and looks like the newest entry
+    ticks.advance(20)
+
+    limiter.allow("c")
+    assert sorted(limiter._slots) == ["b", "c"]
+
+
+def test_rejected_requests_are_counted(ticks):
+    limiter = RateLimiter(rate=1, burst=1)
+
+    for _ in range(4):
+        limiter.allow("a")
+    limiter.allow("b")
+    limiter.allow("b")
+
+    assert limiter.rejected == 4
+
+
+@pytest.mark.parametrize(
+    "rate, retry_after",
+    [(5, 1), (1, 1), (0.5, 2), (0.4, 3)],
+)
+def test_retry_after_is_rounded_up(rate, retry_after):
+    limiter = RateLimiter(rate=rate)
+
+    assert limiter.to_HTTP().startswith("HTTP/1.1 429 Too Many Requests\r\n")
+    assert "Retry-After: {}\r\n".format(retry_after) in limiter.to_HTTP()
@@ -2,10 +2,11 @@
 """
 
 # This also defines the order in which the documentation is generated
-__all__ = ["uAPI", "RequestArgument", "HTTPResponse", "HTTPError"]
+__all__ = ["uAPI", "RequestArgument", "HTTPResponse", "HTTPError", "RateLimiter"]
 
 from .application import uAPI
 from .http_error import HTTPError
 from .http_response import HTTPResponse
+from .rate_limiter import RateLimiter
 from .request_argument import RequestArgument
 from .utils import HTTP_STATUS_CODES, TYPE_LOOKUP, clean_query_string
@@ -12,6 +12,7 @@ import gc
 
 from .http_error import HTTPError
 from .http_response import HTTPResponse
+from .rate_limiter import RateLimiter
 from .request_argument import RequestArgument
 from .utils import _SWAGGER_UI_HTML, TYPE_LOOKUP, clean_query_string
 
@@ -30,6 +31,10 @@ class uAPI:
         title: str = "uAPI",
         description: str = "Built with uAPI",
         version: str = "1.0.0",
+        rate_limiter: RateLimiter = None,
+        cors_origin: str = None,
+        cors_headers: str = "Content-Type",
+        cors_max_age: int = 86400,
     ):
         """Constructor for a new uAPI. Predefines the routes /openapi.json and /docs.
 
@@ -38,11 +43,19 @@ class uAPI:
             title (str, optional): Title of the API used in the openapi.json and therefore in /docs. Defaults to "uAPI".
             description (str, optional): Description of the API used in the openapi.json and therefore in /docs. Defaults to "Built with uAPI".
             version (str, optional): Current version of the API used in /openapi.json and therefore in /docs. Defaults to "1.0.0".
+            rate_limiter (RateLimiter, optional): Limits the amount of requests per client, rejected requests are answered with 429. Defaults to None.
+            cors_origin (str, optional): The origin allowed to access the API from a browser (e.g. "*"), sent as Access-Control-Allow-Origin. If None no CORS headers are sent. Defaults to None.
+            cors_headers (str, optional): The request headers allowed in cross origin requests, sent as Access-Control-Allow-Headers. Defaults to "Content-Type".
+            cors_max_age (int, optional): The amount of seconds browsers may cache a preflight response, sent as Access-Control-Max-Age. Defaults to 86400.
         """
         self.title = title
         self.version = version
         self.description = description
         self.port = port
+        self.rate_limiter = rate_limiter
+        self.cors_origin = cors_origin
+        self.cors_headers = cors_headers
+        self.cors_max_age = cors_max_age
 
         self._socket = None
 
@@ -184,17 +197,79 @@ class uAPI:
         """
         return HTTPResponse(data=_SWAGGER_UI_HTML, content_type="text/html")
 
-    async def _process_connection(self, connection: socket.socket):
+    def _allowed_methods(self, route: Dict[str, dict]) -> str:
+        """Lists the methods that are answered on the route, including the automatically handled HEAD and OPTIONS.
+
+        Args:
+            route (Dict[str, dict]): The configured methods of the requested route.
+
+        Returns:
+            str: The allowed methods, as used in the Allow header.
+        """
+        methods = list(route)
+        if "GET" in route and "HEAD" not in route:
+            methods.append("HEAD")
+        if "OPTIONS" not in route:
+            methods.append("OPTIONS")
+        return ", ".join(methods)
+
+    def _options(self, route: Dict[str, dict]) -> HTTPResponse:
+        """Answers an OPTIONS request (e.g. a CORS preflight) from the methods configured for the route.
+
+        Args:
+            route (Dict[str, dict]): The configured methods of the requested route.
+
+        Returns:
+            HTTPResponse: An empty response listing the allowed methods.
+        """
+        methods = self._allowed_methods(route)
+        headers = {"Allow": methods}
+        if self.cors_origin:
+            headers["Access-Control-Allow-Methods"] = methods
+            headers["Access-Control-Allow-Headers"] = self.cors_headers
+            headers["Access-Control-Max-Age"] = self.cors_max_age
+        return HTTPResponse(status_code=204, content_type=None, headers=headers)
+
+    def _add_cors_headers(self, headers: dict) -> None:
+        """Adds the CORS headers to the given headers, unless they are set already.
+
+        Args:
+            headers (dict): The headers of a response or an error.
+        """
+        if self.cors_origin and "Access-Control-Allow-Origin" not in headers:
+            headers["Access-Control-Allow-Origin"] = self.cors_origin
+
+    def _reject(self, connection: socket.socket) -> None:
+        """Sends the precomputed 429 of the rate limiter and closes the connection.
+
+        Args:
+            connection (socket.socket): The connection of the rejected client.
+        """
+        try:
+            # drain the request, closing with unread data would reset the connection
+            connection.setblocking(False)
+            connection.recv(8 * 1024)
+        except:
+            pass
+        try:
+            connection.send(self.rate_limiter.to_HTTP())
+        finally:
+            connection.close()
+
+    async def _process_connection(self, connection: socket.socket, client=None):
         """Processes a request on a new connection.
 
         Args:
             connection (socket.socket): The connection to process communication on.
+            client (optional): The address of the client, used for per route rate limiting. Defaults to None.
         """
+        head = False
         try:
             request = connection.recv(8 * 1024).decode("ASCII")
 
             lines = request.split("\r\n")
             method, path, _ = lines[0].split(" ")
+            head = method == "HEAD"
 
             question_marks = path.count("?")
             if question_marks == 0:
@@ -210,9 +285,26 @@ class uAPI:
             if not route in self.routes:
                 raise HTTPError(404)
 
+            if self.rate_limiter and self.rate_limiter.per_route:
+                if not self.rate_limiter.allow((client, route)):
+                    self._reject(connection)
+                    return
+
             route = self.routes[route]
             if method not in route:
-                raise HTTPError(405)
+                if method == "OPTIONS":
+                    result = self._options(route)
+                    self._add_cors_headers(result.headers)
+                    connection.send(result.to_HTTP())
+                    connection.close()
+                    return
+                elif head and "GET" in route:
+                    # use the GET handler, the body is dropped below
+                    method = "GET"
+                else:
+                    raise HTTPError(
+                        405, headers={"Allow": self._allowed_methods(route)}
+                    )
 
             query_fragments = query.split("&")
             query_params = {}
@@ -278,19 +370,22 @@ class uAPI:
             # Wrap the result in an HTTPResponse if it is not already one
             if not isinstance(result, HTTPResponse):
                 result = HTTPResponse(data=result)
+            self._add_cors_headers(result.headers)
 
-            connection.send(result.to_HTTP())
+            connection.send(result.to_HTTP(body=not head))
             connection.close()
             return
 
         except HTTPError as e:
-            connection.send(e.to_HTTP())
+            self._add_cors_headers(e.headers)
+            connection.send(e.to_HTTP(body=not head))
             connection.close()
             return
         except Exception as e:
             error = HTTPError(500, str(e))
             print(e)
-            connection.send(error.to_HTTP())
+            self._add_cors_headers(error.headers)
+            connection.send(error.to_HTTP(body=not head))
             connection.close()
 
     async def run(self) -> None:
@@ -315,7 +410,18 @@ class uAPI:
                 gc.collect()
                 conn, addr = self._socket.accept()
                 print("Got a connection from %s" % str(addr))
-                asyncio.create_task(self._process_connection(conn))
+                # only the host identifies a client, the port changes every time
+                if isinstance(addr, tuple):
+                    client = addr[0]
+                else:
+                    # raw AF_INET sockaddr (e.g. unix port), bytes 4 to 8 are the IP
+                    client = bytes(addr[4:8])
+                if self.rate_limiter and not self.rate_limiter.allow(client):
+                    self._reject(conn)
+                    # do not let a rejected client take up the accept slot
+                    await asyncio.sleep_ms(0)
+                    continue
+                asyncio.create_task(self._process_connection(conn, client))
                 await asyncio.sleep_ms(100)
             except:
                 # allow task change
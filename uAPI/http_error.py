@@ -4,12 +4,18 @@ from .utils import HTTP_STATUS_CODES
 class HTTPError(Exception):
     """An HTTP error with an status code and description. Use this Exception subtype in your API endpoints to communicate errors like 400"""
 
-    def __init__(self, status_code: int, description: str = None):
+    def __init__(
+        self,
+        status_code: int,
+        description: str = None,
+        headers: dict = None,
+    ):
         """Constructor for an HTTP error.
 
         Args:
             status_code (int): The status code to be sent.
             description (str, optional): An optional description that will be sent in the body. Defaults to None.
+            headers (dict, optional): Additional headers to be sent. Defaults to None.
 
         Raises:
             Exception: If the status_code is not known.
@@ -19,10 +25,14 @@ class HTTPError(Exception):
 
         self.status_code = status_code
         self.description = description
+        self.headers = headers if headers else {}
 
-    def to_HTTP(self) -> str:
+    def to_HTTP(self, body: bool = True) -> str:
         """Converts the error to an HTTP compatible string that can be sent directly to the client.
 
+        Args:
+            body (bool, optional): Whether or not to send the description as body, set to False for HEAD requests. Defaults to True.
+
         Returns:
             str: The error in HTTP format.
         """
@@ -30,12 +40,14 @@ class HTTPError(Exception):
             self.status_code, HTTP_STATUS_CODES[self.status_code]
         )
 
-        if self.description:
+        if self.description and body:
             http += "Content-Length: {}\r\n".format(len(self.description))
             http += "Content-Type: text/plain\r\n"
+        for header in self.headers:
+            http += "{}: {}\r\n".format(header, self.headers[header])
         http += "Connection: keep-alive\r\n\r\n"
 
-        if self.description:
+        if self.description and body:
             http += self.description
 
         return http
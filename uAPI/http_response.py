@@ -11,13 +11,15 @@ class HTTPResponse:
         data: object = None,
         status_code: int = 200,
         content_type: str = "application/json",
+        headers: dict = None,
     ):
         """Constructor for a HTTP Response.
 
         Args:
             data (object, optional): The data object, if content_type is application/json, this needs to be parsable. If not it needs a string representation. Defaults to None.
             status_code (int, optional): The status code to be sent to the user. Defaults to 200.
-            content_type (str, optional): The content type to be sent to the user. Defaults to "application/json".
+            content_type (str, optional): The content type to be sent to the user. If None no Content-Type is sent. Defaults to "application/json".
+            headers (dict, optional): Additional headers to be sent to the user. Defaults to None.
 
         Raises:
             Exception: If the status_code is unknown.
@@ -27,14 +29,18 @@ class HTTPResponse:
         self.data = data
         self.status_code = status_code
         self.content_type = content_type
+        self.headers = headers if headers else {}
 
-    def to_HTTP(self) -> str:
+    def to_HTTP(self, body: bool = True) -> str:
         """Generates a HTTP compatible string to be sent to the client.
 
+        Args:
+            body (bool, optional): Whether or not to serialize and send the body, set to False for HEAD requests. Defaults to True.
+
         Returns:
             str: The HTTP string.
         """
-        if self.data:
+        if self.data and body:
             if self.content_type is "application/json":
                 data = json.dumps(self.data)
             else:
@@ -45,7 +51,10 @@ class HTTPResponse:
         http = "HTTP/1.1 {} {}\r\n".format(
             self.status_code, HTTP_STATUS_CODES[self.status_code]
         )
-        http += "Content-Type: {}\r\n".format(self.content_type)
+        if self.content_type:
+            http += "Content-Type: {}\r\n".format(self.content_type)
+        for header in self.headers:
+            http += "{}: {}\r\n".format(header, self.headers[header])
 
         if data:
             http += "Content-Length: {}\r\n".format(len(data))
@@ -0,0 +1,123 @@
+import time
+from array import array
+
+from .utils import HTTP_STATUS_CODES
+
+
+class RateLimiter:
+    """A token bucket rate limiter keyed by the client address (and optionally the route). The buckets are stored in a fixed-capacity table, the least recently seen client is evicted when the table is full, so the memory usage stays bounded regardless of how many clients connect."""
+
+    def __init__(
+        self,
+        rate: float = 5,
+        burst: int = 10,
+        capacity: int = 16,
+        per_route: bool = False,
+    ):
+        """Constructor for a RateLimiter.
+
+        Args:
+            rate (float, optional): The amount of requests per second that are refilled into each bucket. Defaults to 5.
+            burst (int, optional): The maximum amount of requests a client can make at once, i.e. the size of each bucket. Defaults to 10.
+            capacity (int, optional): The maximum amount of buckets kept at the same time. Defaults to 16.
+            per_route (bool, optional): Whether each client additionally gets a separate bucket per route, checked once the route is known. The client itself is always checked directly after accepting the connection. Defaults to False.
+
+        Raises:
+            Exception: If rate, burst or capacity are not positive.
+        """
+        if rate <= 0 or burst <= 0 or capacity <= 0:
+            raise Exception("rate, burst and capacity need to be positive!")
+
+        self.rate = rate
+        self.burst = burst
+        self.capacity = capacity
+        self.per_route = per_route
+
+        self.rejected = 0
+        """The amount of requests that were rejected since the limiter was created."""
+
+        # slot lookup, the bucket state itself lives in the preallocated arrays
+        self._slots = {}
+        self._keys = [None] * capacity
+        self._tokens = array("f", [0] * capacity)
+        self._stamps = array("L", [0] * capacity)
+
+        retry_after = int(1 / rate)
+        if retry_after < 1 / rate:
+            retry_after += 1
+        self._response = (
+            "HTTP/1.1 429 {}\r\n"
+            "Retry-After: {}\r\n"
+            "Content-Length: 0\r\n"
+            "Connection: close\r\n\r\n".format(HTTP_STATUS_CODES[429], retry_after)
+        )
+
+    def _slot(self, key, now: int) -> int:
+        """Returns the slot of the bucket for the given key. If the key is not known yet, a free slot or the least recently used one is (re)initialized with a full bucket.
+
+        Args:
+            key: The key of the bucket.
+            now (int): The current time in ticks_ms.
+
+        Returns:
+            int: The index of the bucket in the table.
+        """
+        if key in self._slots:
+            return self._slots[key]
+
+        if len(self._slots) < self.capacity:
+            slot = len(self._slots)
+        else:
+            slot = 0
+            oldest = 0
+            for i in range(self.capacity):
+                age = time.ticks_diff(now, self._stamps[i])
+                if age < 0:
+                    # idle for over half the ticks period, older than any other
+                    slot = i
+                    break
+                if age > oldest:
+                    oldest = age
+                    slot = i
+            del self._slots[self._keys[slot]]
+
+        self._slots[key] = slot
+        self._keys[slot] = key
+        self._tokens[slot] = self.burst
+        self._stamps[slot] = now
+        return slot
+
+    def allow(self, key) -> bool:
+        """Takes a token from the bucket of the given key, counting the request as rejected if there is none left.
+
+        Args:
+            key: The key of the bucket, usually the client address or a tuple of client address and route.
+
+        Returns:
+            bool: Whether or not the request is allowed.
+        """
+        now = time.ticks_ms()
+        slot = self._slot(key, now)
+
+        elapsed = time.ticks_diff(now, self._stamps[slot])
+        # negative if the bucket was idle for over half the ticks period
+        tokens = self._tokens[slot] + elapsed * self.rate / 1000
+        if elapsed < 0 or tokens > self.burst:
+            tokens = self.burst
+        self._stamps[slot] = now
+
+        if tokens < 1:
+            self._tokens[slot] = tokens
+            self.rejected += 1
+            return False
+
+        self._tokens[slot] = tokens - 1
+        return True
+
+    def to_HTTP(self) -> str:
+        """Returns the precomputed 429 response that is sent to rejected clients.
+
+        Returns:
+            str: The response in HTTP format.
+        """
+        return self._response